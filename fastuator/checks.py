@@ -1,12 +1,21 @@
-"""Default health check implementations."""
+"""Default health check implementations.
+
+psutil calls are synchronous, so each check runs them in a worker thread via
+``asyncio.to_thread`` to keep the event loop free. Checks must never sleep or
+sample over an interval on the event loop; ``cpu_health`` therefore uses
+``psutil.cpu_percent(interval=None)``, which returns the usage since the
+previous call instead of blocking to measure it.
+"""
 
 from typing import Any
+import asyncio
+
 import psutil
 
 
 async def cpu_health() -> dict[str, Any]:
     """Check CPU usage."""
-    cpu_percent = psutil.cpu_percent(interval=0.1)
+    cpu_percent = await asyncio.to_thread(psutil.cpu_percent, interval=None)
     status = "UP" if cpu_percent < 90 else "DOWN"
     return {
         "status": status,
@@ -16,7 +25,7 @@ async def cpu_health() -> dict[str, Any]:
 
 async def memory_health() -> dict[str, Any]:
     """Check memory usage."""
-    memory = psutil.virtual_memory()
+    memory = await asyncio.to_thread(psutil.virtual_memory)
     status = "UP" if memory.percent < 90 else "DOWN"
     return {
         "status": status,
@@ -27,7 +36,7 @@ async def memory_health() -> dict[str, Any]:
 
 async def disk_health() -> dict[str, Any]:
     """Check disk usage."""
-    disk = psutil.disk_usage("/")
+    disk = await asyncio.to_thread(psutil.disk_usage, "/")
     status = "UP" if disk.percent < 90 else "DOWN"
     return {
         "status": status,
@@ -9,23 +9,139 @@ from __future__ import annotations
 
 from typing import Any, Awaitable, Callable
 import asyncio
+import functools
 import time
 import importlib.metadata
-import platform
-
-from fastapi import APIRouter, FastAPI, HTTPException, Request
-from prometheus_client import Counter, Gauge, Histogram, make_asgi_app, REGISTRY
-import psutil
-
-
+import json
+
+from fastapi import APIRouter, FastAPI, HTTPException, Request, Response
+from prometheus_client import (
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    make_asgi_app,
+    ProcessCollector,
+)
+
+# Safety cap on the number of cached request counter children
+_LABEL_CACHE_SIZE = 1024
+
+# Endpoint label shared by requests that match no route, so a 404 scan adds
+# one series rather than one per probed path
+_UNMATCHED_ENDPOINT = "<unmatched>"
+
+# Buffered request metrics are flushed to Prometheus once this many requests
+# are pending, or this many seconds after the first one, whichever comes first
+_METRICS_FLUSH_SIZE = 256
+_METRICS_FLUSH_INTERVAL = 0.1
+
+# Shared responses for the common cases; these are only ever serialized,
+# never mutated, so one instance can be returned from every request
+_UP: dict[str, Any] = {"status": "UP"}
+_DOWN: dict[str, Any] = {"status": "DOWN"}
+_TIMED_OUT: dict[str, Any] = {"status": "DOWN", "error": "timeout"}
+_UP_BYTES = b'{"status":"UP"}'
+
+
+@functools.lru_cache(maxsize=1)
 def get_package_version() -> str:
-    """Get package version dynamically."""
+    """Get package version dynamically, cached after the first lookup."""
     try:
         return importlib.metadata.version("fastuator")
     except importlib.metadata.PackageNotFoundError:
         return "dev"
 
 
+def _build_info_payload() -> dict[str, Any]:
+    """Build the static build and system information served by /info."""
+    # Only needed once per instance, so keep it off the import path
+    import platform
+
+    return {
+        "build": {
+            "version": get_package_version(),
+            "python": platform.python_version(),
+        },
+        "system": {
+            "platform": platform.platform(),
+            "python_implementation": platform.python_implementation(),
+        },
+    }
+
+
+def _consume_exception(task: asyncio.Task[Any]) -> None:
+    """Mark a task's exception as retrieved so unawaited failures are not logged."""
+    if not task.cancelled():
+        task.exception()
+
+
+class _CachedCheck:
+    """
+    Health check wrapper that caches results for a short TTL.
+
+    Probe traffic from Kubernetes and Prometheus tends to arrive in bursts;
+    caching collapses those into roughly one underlying check per TTL window
+    instead of one psutil call per request. A check can override the default
+    TTL by setting a ``_ttl`` attribute (in seconds) on the function.
+
+    Only successful results are cached; exceptions propagate to the caller
+    and the next call runs the check again.
+
+    Concurrent callers arriving while the check is already running await the
+    same in-flight task instead of starting another execution, which keeps
+    a cold cache from turning a burst of probes into a burst of checks. The
+    check runs in its own task and every caller awaits it through
+    ``asyncio.shield``, so one caller timing out or being cancelled never
+    fails the result for the others. The shared run is itself cancelled after
+    ``timeout`` seconds, so a check that hangs once is retried by the next
+    caller instead of being joined forever.
+
+    Args:
+        check: Async health check callable
+        ttl: Cache lifetime in seconds
+        timeout: Seconds a single run of the check may take
+    """
+
+    def __init__(
+        self,
+        check: Callable[[], Awaitable[dict[str, Any]]],
+        ttl: float = 1.0,
+        timeout: float = 5.0,
+    ) -> None:
+        functools.update_wrapper(self, check)
+        self.check = check
+        self.ttl = ttl
+        self.timeout = timeout
+        self.expires_at = 0.0
+        self.result: dict[str, Any] | None = None
+        self._inflight: asyncio.Task[dict[str, Any]] | None = None
+
+    async def __call__(self) -> dict[str, Any]:
+        if self.result is not None and time.monotonic() < self.expires_at:
+            return self.result
+
+        # Start a run unless one is already in flight on this loop; a task
+        # left over from a loop that has since closed can never complete
+        inflight = self._inflight
+        if inflight is None or inflight.get_loop() is not asyncio.get_running_loop():
+            inflight = self._inflight = asyncio.ensure_future(self._refresh())
+            inflight.add_done_callback(_consume_exception)
+
+        return await asyncio.shield(inflight)
+
+    async def _refresh(self) -> dict[str, Any]:
+        """Run the underlying check and cache its result."""
+        try:
+            result = await asyncio.wait_for(self.check(), self.timeout)
+            self.result = result
+            self.expires_at = time.monotonic() + self.ttl
+            return result
+        finally:
+            if self._inflight is asyncio.current_task():
+                self._inflight = None
+
+
 class Fastuator:
     """
     Production-ready monitoring toolkit for FastAPI applications.
@@ -60,6 +176,14 @@ class Fastuator:
         liveness_checks: Health checks for K8s liveness probe (default: CPU only)
         readiness_checks: Health checks for K8s readiness probe (default: all checks)
         enable_metrics: Enable Prometheus metrics collection (default: True)
+        registry: Prometheus registry for fastuator metrics (default: a dedicated
+            registry per instance, so scrapes only carry fastuator's own series)
+        max_concurrent_checks: Maximum number of checks one endpoint call runs at once
+            (default: 10)
+        include_process_collector: Also export process CPU/memory/fd metrics (default: False)
+
+    Raises:
+        ValueError: If max_concurrent_checks is less than 1
     """
 
     def __init__(
@@ -70,7 +194,15 @@ class Fastuator:
         liveness_checks: list[Callable[[], Awaitable[dict[str, Any]]]] | None = None,
         readiness_checks: list[Callable[[], Awaitable[dict[str, Any]]]] | None = None,
         enable_metrics: bool = True,
+        registry: CollectorRegistry | None = None,
+        max_concurrent_checks: int = 10,
+        include_process_collector: bool = False,
     ) -> None:
+        if max_concurrent_checks < 1:
+            raise ValueError(
+                f"max_concurrent_checks must be at least 1, got {max_concurrent_checks}"
+            )
+
         self.app = app
         self.prefix = prefix
         self.router = APIRouter(prefix=prefix, tags=["fastuator"])
@@ -83,31 +215,66 @@ class Fastuator:
         self.liveness_checks = liveness_checks or [cpu_health]
         self.readiness_checks = readiness_checks or self.health_checks
 
-        use_test_registry = False
-        test_registry = None
-        if "pytest" in [m.__name__ for m in __import__("sys").modules.values()]:
-            from prometheus_client import CollectorRegistry
+        # Wrap checks with a TTL cache, sharing one wrapper per function so the
+        # same check listed under several endpoints is only run once per TTL.
+        # Keyed by id() so unhashable callables (e.g. dataclass instances) work;
+        # each wrapper holds its check, keeping the id valid while in use
+        cached: dict[int, _CachedCheck] = {}
+
+        def _cached(fn: Callable[[], Awaitable[dict[str, Any]]]) -> _CachedCheck:
+            if id(fn) not in cached:
+                cached[id(fn)] = _CachedCheck(fn, ttl=getattr(fn, "_ttl", 1.0))
+            return cached[id(fn)]
+
+        self.health_checks = [_cached(fn) for fn in self.health_checks]
+        self.liveness_checks = [_cached(fn) for fn in self.liveness_checks]
+        self.readiness_checks = [_cached(fn) for fn in self.readiness_checks]
+
+        # Component names for health details, fixed once checks are configured
+        self._health_check_names = [
+            getattr(check, "__name__", f"check_{i}") for i, check in enumerate(self.health_checks)
+        ]
 
-            test_registry = CollectorRegistry()
-            use_test_registry = True
+        # Bound check fan-out so one endpoint call cannot pile load on backends
+        self.max_concurrent_checks = max_concurrent_checks
+
+        # Build and platform details are constant for the process lifetime,
+        # so serialize them once rather than on every request
+        self._info_payload = _build_info_payload()
+        self._info_bytes = json.dumps(
+            self._info_payload, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+
+        self.registry = registry if registry is not None else CollectorRegistry(auto_describe=True)
+        if include_process_collector:
+            ProcessCollector(registry=self.registry)
 
         self.request_count = Counter(
             "http_requests_total",
             "Total HTTP requests",
             ["method", "endpoint", "status"],
-            registry=test_registry if use_test_registry else REGISTRY,
+            registry=self.registry,
         )
         self.request_duration = Histogram(
             "http_request_duration_seconds",
             "HTTP request duration in seconds",
             buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
-            registry=test_registry if use_test_registry else REGISTRY,
+            registry=self.registry,
         )
         self.health_status = Gauge(
             "app_health_status",
             "Application health status (1=UP, 0=DOWN)",
-            registry=test_registry if use_test_registry else REGISTRY,
+            registry=self.registry,
         )
+        self._last_health_value: int | None = None
+
+        # Bound request counter children keyed by (method, endpoint, status)
+        self._label_cache: dict[tuple[str, str, int], Counter] = {}
+
+        # Request metrics waiting to be flushed, as ((method, endpoint, status), duration)
+        self._pending_metrics: list[tuple[tuple[str, str, int], float]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_loop: asyncio.AbstractEventLoop | None = None
 
         # Setup endpoints
         self._register_health_endpoints()
@@ -120,132 +287,220 @@ class Fastuator:
         # Register router with FastAPI app
         app.include_router(self.router)
 
-    def _register_health_endpoints(self) -> None:
-        """Register health check, liveness, readiness, and info endpoints."""
+    def _start_checks(
+        self, checks: list[Callable[[], Awaitable[dict[str, Any]]]]
+    ) -> list[asyncio.Task[dict[str, Any]]]:
+        """
+        Start one task per health check, with at most ``max_concurrent_checks``
+        running at once.
 
-        @self.router.get("/health")
-        async def health(show_details: bool = False) -> dict[str, Any]:
-            """
-            Aggregate health check endpoint.
+        The limit is scoped to this call, so a hung readiness or database check
+        can never hold the slots that liveness checks need.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_checks)
 
-            Returns overall status based on all registered health checks.
-            If any check returns DOWN, the overall status is DOWN.
+        async def bounded(check: Callable[[], Awaitable[dict[str, Any]]]) -> dict[str, Any]:
+            async with semaphore:
+                return await check()
 
-            Query Parameters:
-                show_details: Include detailed component status (default: False)
+        return [asyncio.ensure_future(bounded(check)) for check in checks]
 
-            Returns:
-                {"status": "UP"} or {"status": "DOWN", "components": {...}}
-            """
-            checks = await asyncio.gather(
-                *[asyncio.wait_for(check(), timeout=5.0) for check in self.health_checks],
-                return_exceptions=True,
-            )
+    async def _run_checks(
+        self,
+        checks: list[Callable[[], Awaitable[dict[str, Any]]]],
+        timeout: float = 5.0,
+    ) -> list[dict[str, Any] | BaseException]:
+        """
+        Run health checks concurrently under one shared timeout.
 
-            # Handle exceptions in health checks
-            processed_checks = []
-            for i, check_result in enumerate(checks):
-                if isinstance(check_result, Exception):
-                    processed_checks.append(
-                        {
-                            "status": "DOWN",
-                            "error": str(check_result),
-                        }
-                    )
-                else:
-                    processed_checks.append(check_result)
-
-            # Aggregate status: DOWN if any component is DOWN
-            statuses = [c.get("status", "DOWN") for c in processed_checks]
-            overall_status = "DOWN" if "DOWN" in statuses else "UP"
-
-            # Update Prometheus gauge
-            self.health_status.set(1 if overall_status == "UP" else 0)
-
-            result = {"status": overall_status}
-            if show_details:
-                result["components"] = {
-                    getattr(check, "__name__", f"check_{i}"): check_result
-                    for i, (check, check_result) in enumerate(
-                        zip(self.health_checks, processed_checks)
-                    )
-                }
+        At most ``max_concurrent_checks`` checks of this call run at the same
+        time; the rest wait for a free slot within the same timeout.
 
-            return result
+        Checks still running when the timeout expires are cancelled and
+        reported as DOWN. Exceptions raised by a check are returned in its
+        place, in the same way as ``asyncio.gather(return_exceptions=True)``.
+
+        Args:
+            checks: Health check functions to run
+            timeout: Seconds to wait for all checks to complete
+
+        Returns:
+            One result or exception per check, in the order given
+        """
+        if not checks:
+            return []
+
+        # A single check needs no task fan-out; await it directly
+        if len(checks) == 1:
+            try:
+                return [await asyncio.wait_for(checks[0](), timeout)]
+            except asyncio.TimeoutError:
+                return [_TIMED_OUT]
+            except Exception as exc:
+                return [exc]
+
+        tasks = self._start_checks(checks)
+        try:
+            _, pending = await asyncio.wait(tasks, timeout=timeout)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        results: list[dict[str, Any] | BaseException] = []
+        for task in tasks:
+            if task in pending:
+                results.append(_TIMED_OUT)
+            elif task.exception() is not None:
+                results.append(task.exception())
+            else:
+                results.append(task.result())
+        return results
+
+    async def _all_checks_up(
+        self,
+        checks: list[Callable[[], Awaitable[dict[str, Any]]]],
+        timeout: float = 5.0,
+    ) -> bool:
+        """
+        Report whether every health check is UP, stopping at the first failure.
 
-        @self.router.get("/liveness")
-        async def liveness() -> dict[str, str]:
-            """
-            Kubernetes liveness probe endpoint.
+        Unlike ``_run_checks``, this does not wait for the remaining checks
+        once one has returned DOWN, raised, or the timeout has expired; they
+        are cancelled instead. Probes only need the verdict, so this keeps
+        their latency bounded by the fastest failing check.
 
-            Checks only critical system components (e.g., CPU).
-            Returns 503 if any liveness check fails.
+        Args:
+            checks: Health check functions to run
+            timeout: Seconds to wait for all checks to complete
 
-            This follows the isolation pattern: external dependencies
-            (DB, Redis) should not affect liveness to prevent cascading failures.
+        Returns:
+            True if all checks returned UP within the timeout
+        """
+        # A single check needs no task fan-out; await it directly
+        if len(checks) == 1:
+            try:
+                check_result = await asyncio.wait_for(checks[0](), timeout)
+            except Exception:
+                return False
+            return check_result.get("status") == "UP"
+
+        tasks = self._start_checks(checks)
+        try:
+            for next_result in asyncio.as_completed(tasks, timeout=timeout):
+                try:
+                    check_result = await next_result
+                except Exception:
+                    # Covers both a failing check and the shared timeout
+                    return False
+                if check_result.get("status") != "UP":
+                    return False
+            return True
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _health(self, show_details: bool = False) -> dict[str, Any]:
+        """
+        Aggregate health check endpoint.
 
-            Returns:
-                {"status": "UP"} or raises HTTPException(503)
-            """
-            checks = await asyncio.gather(
-                *[asyncio.wait_for(check(), timeout=5.0) for check in self.liveness_checks],
-                return_exceptions=True,
+        Returns overall status based on all registered health checks.
+        If any check returns DOWN, the overall status is DOWN.
+
+        Query Parameters:
+            show_details: Include detailed component status (default: False)
+
+        Returns:
+            {"status": "UP"} or {"status": "DOWN", "components": {...}}
+        """
+        checks = await self._run_checks(self.health_checks)
+
+        # Handle exceptions in health checks
+        processed_checks = [
+            (
+                {**_DOWN, "error": str(check_result)}
+                if isinstance(check_result, Exception)
+                else check_result
             )
+            for check_result in checks
+        ]
+
+        # Aggregate status: DOWN if any component is DOWN
+        overall_status = "UP"
+        for check_result in processed_checks:
+            if check_result.get("status", "DOWN") == "DOWN":
+                overall_status = "DOWN"
+                break
+
+        # Update Prometheus gauge only when the status changes
+        health_value = 1 if overall_status == "UP" else 0
+        if health_value != self._last_health_value:
+            self.health_status.set(health_value)
+            self._last_health_value = health_value
+
+        if not show_details:
+            return _UP if overall_status == "UP" else _DOWN
+
+        return {
+            "status": overall_status,
+            "components": dict(zip(self._health_check_names, processed_checks)),
+        }
+
+    async def _liveness(self) -> Response:
+        """
+        Kubernetes liveness probe endpoint.
+
+        Checks only critical system components (e.g., CPU).
+        Returns 503 if any liveness check fails.
 
-            for check_result in checks:
-                if isinstance(check_result, Exception) or check_result.get("status") != "UP":
-                    raise HTTPException(
-                        status_code=503,
-                        detail="Liveness check failed",
-                    )
-
-            return {"status": "UP"}
-
-        @self.router.get("/readiness")
-        async def readiness() -> dict[str, str]:
-            """
-            Kubernetes readiness probe endpoint.
-
-            Checks all dependencies including external services.
-            Returns 503 if any readiness check fails.
-
-            Returns:
-                {"status": "UP"} or raises HTTPException(503)
-            """
-            checks = await asyncio.gather(
-                *[asyncio.wait_for(check(), timeout=5.0) for check in self.readiness_checks],
-                return_exceptions=True,
+        This follows the isolation pattern: external dependencies
+        (DB, Redis) should not affect liveness to prevent cascading failures.
+
+        Returns:
+            {"status": "UP"} or raises HTTPException(503)
+        """
+        if not await self._all_checks_up(self.liveness_checks):
+            raise HTTPException(
+                status_code=503,
+                detail="Liveness check failed",
+            )
+
+        return Response(content=_UP_BYTES, media_type="application/json")
+
+    async def _readiness(self) -> Response:
+        """
+        Kubernetes readiness probe endpoint.
+
+        Checks all dependencies including external services.
+        Returns 503 if any readiness check fails.
+
+        Returns:
+            {"status": "UP"} or raises HTTPException(503)
+        """
+        if not await self._all_checks_up(self.readiness_checks):
+            raise HTTPException(
+                status_code=503,
+                detail="Readiness check failed",
             )
 
-            for check_result in checks:
-                if isinstance(check_result, Exception) or check_result.get("status") != "UP":
-                    raise HTTPException(
-                        status_code=503,
-                        detail="Readiness check failed",
-                    )
-
-            return {"status": "UP"}
-
-        @self.router.get("/info")
-        async def info() -> dict[str, Any]:
-            """
-            Application and system information endpoint.
-
-            Returns build version, Python version, and platform details.
-
-            Returns:
-                Dictionary with build and system information
-            """
-            return {
-                "build": {
-                    "version": get_package_version(),
-                    "python": platform.python_version(),
-                },
-                "system": {
-                    "platform": platform.platform(),
-                    "python_implementation": platform.python_implementation(),
-                },
-            }
+        return Response(content=_UP_BYTES, media_type="application/json")
+
+    async def _info(self) -> Response:
+        """
+        Application and system information endpoint.
+
+        Returns build version, Python version, and platform details.
+
+        Returns:
+            Pre-serialized JSON with build and system information
+        """
+        return Response(content=self._info_bytes, media_type="application/json")
+
+    def _register_health_endpoints(self) -> None:
+        """Register health check, liveness, readiness, and info endpoints."""
+        self.router.add_api_route("/health", self._health, methods=["GET"], name="health")
+        self.router.add_api_route("/liveness", self._liveness, methods=["GET"], name="liveness")
+        self.router.add_api_route("/readiness", self._readiness, methods=["GET"], name="readiness")
+        self.router.add_api_route("/info", self._info, methods=["GET"], name="info")
 
     def _register_metrics_endpoint(self, app: FastAPI, prefix: str) -> None:
         """
@@ -255,14 +510,55 @@ class Fastuator:
             app: FastAPI application instance
             prefix: Fastuator URL prefix
         """
-        metrics_app = make_asgi_app()
-        app.mount(f"{prefix}/metrics", metrics_app)
+        metrics_app = make_asgi_app(registry=self.registry)
+
+        async def flushing_metrics_app(scope, receive, send):
+            # Record buffered requests so a scrape never reads stale counts
+            self._flush_metrics()
+            await metrics_app(scope, receive, send)
+
+        app.mount(f"{prefix}/metrics", flushing_metrics_app)
+
+    def _flush_metrics(self) -> None:
+        """
+        Record buffered request metrics on the Prometheus collectors.
+
+        Requests sharing a label set are folded into a single ``inc(count)``,
+        so each counter child's lock is taken once per flush rather than once
+        per request.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+            self._flush_loop = None
+        if not self._pending_metrics:
+            return
+
+        # Drain in place; the middleware holds a reference to this list
+        batch = self._pending_metrics[:]
+        del self._pending_metrics[:]
+
+        counts: dict[tuple[str, str, int], int] = {}
+        for key, duration in batch:
+            counts[key] = counts.get(key, 0) + 1
+            self.request_duration.observe(duration)
+
+        for key, count in counts.items():
+            counter = self._label_cache.get(key)
+            if counter is None:
+                counter = self.request_count.labels(*key)
+                if len(self._label_cache) < _LABEL_CACHE_SIZE:
+                    self._label_cache[key] = counter
+            counter.inc(count)
 
     def _register_metrics_middleware(self, app: FastAPI) -> None:
         """
         Register middleware for automatic metrics collection.
 
-        Collects HTTP request count and duration for all endpoints.
+        Collects HTTP request count and duration for all endpoints except
+        the metrics endpoint itself, so scrapes do not instrument themselves.
+        Measurements are buffered and recorded by ``_flush_metrics`` off the
+        request path, after a short delay, when the buffer fills, or on scrape.
 
         Args:
             app: FastAPI application instance
@@ -272,21 +568,42 @@ class Fastuator:
             return
         app.state._fastuator_metrics_middleware = True
 
+        pending = self._pending_metrics
+        metrics_path = f"{self.prefix}/metrics"
+
         @app.middleware("http")
         async def metrics_middleware(request: Request, call_next):
             """Collect HTTP request metrics."""
-            start_time = time.time()
+            # Read straight from the ASGI scope; request.url would build a
+            # URL object on every call
+            scope = request.scope
+            path = scope["path"]
+            if path.startswith(metrics_path):
+                return await call_next(request)
+
+            start_time = time.perf_counter()
 
             # Process request
             response = await call_next(request)
 
-            # Record metrics
-            duration = time.time() - start_time
-            self.request_count.labels(
-                method=request.method,
-                endpoint=request.url.path,
-                status=response.status_code,
-            ).inc()
-            self.request_duration.observe(duration)
+            # Buffer metrics; _flush_metrics records them off the request path
+            duration = time.perf_counter() - start_time
+
+            # Label by route template (/users/{id}) rather than the raw URL
+            # to keep one series per route instead of one per ID
+            route = scope.get("route")
+            endpoint = route.path if route is not None else _UNMATCHED_ENDPOINT
+            pending.append(((scope["method"], endpoint, response.status_code), duration))
+
+            loop = asyncio.get_running_loop()
+            if len(pending) >= _METRICS_FLUSH_SIZE:
+                self._flush_metrics()
+            elif self._flush_loop is not None and self._flush_loop is not loop:
+                # The pending timer belongs to another, possibly closed, loop
+                # and may never fire; record everything buffered so far now
+                self._flush_metrics()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(_METRICS_FLUSH_INTERVAL, self._flush_metrics)
+                self._flush_loop = loop
 
             return response
@@ -3,6 +3,7 @@
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from prometheus_client import CollectorRegistry
 from fastuator import Fastuator
 import asyncio
 
@@ -98,6 +99,33 @@ def exception_readiness_client():
     return TestClient(app)
 
 
+@pytest.fixture
+def registry():
+    """Create an isolated Prometheus registry for metric assertions."""
+    return CollectorRegistry()
+
+
+@pytest.fixture
+def fastuator(registry):
+    """Create a Fastuator instance with default checks on a bare app."""
+    return Fastuator(FastAPI(), registry=registry)
+
+
+@pytest.fixture
+def make_client(registry):
+    """Return a factory building a test client for a Fastuator configuration.
+
+    Keyword arguments are passed to Fastuator; metrics go to ``registry``.
+    """
+
+    def _make_client(**kwargs) -> TestClient:
+        app = FastAPI()
+        Fastuator(app, registry=registry, **kwargs)
+        return TestClient(app)
+
+    return _make_client
+
+
 def test_v010_duplicate_prevention():
     """Test v0.1.0: No duplicate middleware registration."""
     app = FastAPI()
@@ -0,0 +1,200 @@
+"""Test health check caching, coalescing and concurrent execution."""
+
+import asyncio
+import time
+
+import pytest
+
+from fastapi import FastAPI
+from fastuator import Fastuator
+from fastuator.core import _CachedCheck
+
+
+async def fast_check():
+    return {"status": "UP"}
+
+
+async def slow_check():
+    await asyncio.sleep(10)
+    return {"status": "UP"}
+
+
+async def down_check():
+    return {"status": "DOWN"}
+
+
+async def failing_check():
+    raise RuntimeError("boom")
+
+
+async def test_concurrent_checks_coalesced():
+    """Test concurrent callers share a single in-flight check execution."""
+    calls = []
+
+    async def counting_check():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"status": "UP"}
+
+    check = _CachedCheck(counting_check, ttl=0)
+    results = await asyncio.gather(*[check() for _ in range(5)])
+
+    assert len(calls) == 1
+    assert all(r == {"status": "UP"} for r in results)
+
+
+async def test_concurrent_check_exception_shared():
+    """Test callers joining an in-flight check receive its exception."""
+
+    async def slow_failing_check():
+        await asyncio.sleep(0.05)
+        raise RuntimeError("boom")
+
+    check = _CachedCheck(slow_failing_check)
+    results = await asyncio.gather(*[check() for _ in range(3)], return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+async def test_run_checks_shared_timeout(fastuator):
+    """Test checks still pending at the shared timeout are reported DOWN."""
+    results = await fastuator._run_checks([fast_check, slow_check, failing_check], timeout=0.05)
+
+    assert results[0] == {"status": "UP"}
+    assert results[1] == {"status": "DOWN", "error": "timeout"}
+    assert isinstance(results[2], RuntimeError)
+
+
+async def test_run_checks_single_check(fastuator):
+    """Test a lone check reports results, exceptions and timeouts like a group."""
+    assert await fastuator._run_checks([fast_check]) == [{"status": "UP"}]
+    assert await fastuator._run_checks([slow_check], timeout=0.05) == [
+        {"status": "DOWN", "error": "timeout"}
+    ]
+    assert isinstance((await fastuator._run_checks([failing_check]))[0], RuntimeError)
+
+
+async def test_run_checks_bounded_concurrency(registry):
+    """Test max_concurrent_checks caps how many checks run at once."""
+    running = 0
+    peak = 0
+
+    async def tracking_check():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {"status": "UP"}
+
+    fastuator = Fastuator(FastAPI(), registry=registry, max_concurrent_checks=2)
+    results = await fastuator._run_checks([tracking_check] * 6)
+
+    assert all(r == {"status": "UP"} for r in results)
+    assert peak == 2
+
+
+@pytest.mark.parametrize("max_concurrent_checks", [0, -1])
+def test_invalid_max_concurrent_checks(registry, max_concurrent_checks):
+    """Test a concurrency limit below 1 is rejected at construction."""
+    with pytest.raises(ValueError, match="max_concurrent_checks"):
+        Fastuator(FastAPI(), registry=registry, max_concurrent_checks=max_concurrent_checks)
+
+
+async def test_all_checks_up_results(fastuator):
+    """Test probes report UP only when every check is UP within the timeout."""
+    assert await fastuator._all_checks_up([fast_check]) is True
+    assert await fastuator._all_checks_up([fast_check, fast_check]) is True
+    assert await fastuator._all_checks_up([failing_check]) is False
+    assert await fastuator._all_checks_up([fast_check, failing_check]) is False
+    assert await fastuator._all_checks_up([slow_check], timeout=0.05) is False
+    assert await fastuator._all_checks_up([fast_check, slow_check], timeout=0.05) is False
+
+
+async def test_all_checks_up_stops_at_first_failure(fastuator):
+    """Test probes return as soon as one check fails instead of waiting for all."""
+    start = time.monotonic()
+    assert await fastuator._all_checks_up([slow_check, down_check]) is False
+    assert time.monotonic() - start < 1
+
+
+async def test_cancelled_caller_does_not_fail_joined_callers():
+    """Test cancelling the caller that started a check leaves other callers unaffected."""
+    calls = []
+
+    async def slow_ok_check():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"status": "UP"}
+
+    check = _CachedCheck(slow_ok_check)
+    first = asyncio.ensure_future(check())
+    await asyncio.sleep(0)
+    second = asyncio.ensure_future(check())
+    await asyncio.sleep(0)
+
+    first.cancel()
+
+    assert await second == {"status": "UP"}
+    assert first.cancelled()
+    assert len(calls) == 1
+
+
+async def test_concurrency_limit_scoped_per_call(registry):
+    """Test hung checks in one endpoint call cannot starve another call's slots."""
+
+    async def hung_db_check():
+        await asyncio.sleep(10)
+        return {"status": "UP"}
+
+    fastuator = Fastuator(FastAPI(), registry=registry, max_concurrent_checks=2)
+    hung = [
+        asyncio.ensure_future(fastuator._run_checks([hung_db_check, hung_db_check]))
+        for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+
+    try:
+        assert await fastuator._all_checks_up([fast_check, fast_check], timeout=0.5) is True
+    finally:
+        for task in hung:
+            task.cancel()
+
+
+def test_concurrency_limit_across_event_loops(make_client):
+    """Test contended checks keep working when requests run on different loops."""
+
+    async def first_check():
+        await asyncio.sleep(0.01)
+        return {"status": "UP"}
+
+    async def second_check():
+        await asyncio.sleep(0.01)
+        return {"status": "UP"}
+
+    first_check._ttl = second_check._ttl = 0
+    checks = [first_check, second_check]
+    client = make_client(health_checks=checks, readiness_checks=checks, max_concurrent_checks=1)
+
+    for _ in range(3):
+        assert client.get("/fastuator/health").json() == {"status": "UP"}
+        assert client.get("/fastuator/readiness").status_code == 200
+
+
+async def test_hung_check_recovers():
+    """Test a check that hangs once is re-run by later callers."""
+    calls = []
+
+    async def hangs_once_check():
+        calls.append(1)
+        if len(calls) == 1:
+            await asyncio.sleep(10)
+        return {"status": "UP"}
+
+    check = _CachedCheck(hangs_once_check, ttl=0, timeout=0.05)
+
+    results = await asyncio.gather(check(), check(), return_exceptions=True)
+    assert all(isinstance(r, asyncio.TimeoutError) for r in results)
+
+    assert await check() == {"status": "UP"}
+    assert len(calls) == 2
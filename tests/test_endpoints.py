@@ -1,5 +1,8 @@
 """Test basic Fastuator endpoints."""
 
+from dataclasses import dataclass
+from unittest.mock import patch
+
 from fastapi.testclient import TestClient
 
 
@@ -117,3 +120,91 @@ def test_readiness_with_exception(exception_readiness_client: TestClient):
 
     data = response.json()
     assert "detail" in data
+
+
+def test_health_check_results_cached(make_client):
+    """Test repeated probes within the TTL reuse the cached check result."""
+    calls = []
+
+    async def counting_check():
+        calls.append(1)
+        return {"status": "UP"}
+
+    client = make_client(health_checks=[counting_check])
+
+    for _ in range(3):
+        assert client.get("/fastuator/health").status_code == 200
+    assert client.get("/fastuator/readiness").status_code == 200
+
+    assert len(calls) == 1
+
+
+def test_health_check_custom_ttl(make_client):
+    """Test a check's _ttl attribute controls its cache lifetime."""
+    calls = []
+
+    async def uncached_check():
+        calls.append(1)
+        return {"status": "UP"}
+
+    uncached_check._ttl = 0
+
+    client = make_client(health_checks=[uncached_check])
+    client.get("/fastuator/health")
+    client.get("/fastuator/health")
+
+    assert len(calls) == 2
+
+
+def test_unhashable_callable_check(make_client):
+    """Test callable instances that are not hashable can be used as checks."""
+
+    @dataclass
+    class DbCheck:
+        dsn: str
+
+        async def __call__(self):
+            return {"status": "UP", "dsn": self.dsn}
+
+    client = make_client(health_checks=[DbCheck("postgresql://db")])
+    response = client.get("/fastuator/health?show_details=true")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "UP"
+
+
+def test_info_payload_precomputed(client: TestClient):
+    """Test /info is built once at init rather than per request."""
+    with patch("platform.platform") as mock_platform:
+        data = client.get("/fastuator/info").json()
+
+    mock_platform.assert_not_called()
+    assert "platform" in data["system"]
+
+
+def test_health_gauge_tracks_status_changes(make_client, registry):
+    """Test the health gauge follows status transitions."""
+    status = {"status": "UP"}
+
+    async def toggling_check():
+        return dict(status)
+
+    toggling_check._ttl = 0
+
+    client = make_client(health_checks=[toggling_check])
+
+    client.get("/fastuator/health")
+    assert registry.get_sample_value("app_health_status") == 1
+
+    status["status"] = "DOWN"
+    client.get("/fastuator/health")
+    assert registry.get_sample_value("app_health_status") == 0
+
+
+def test_probe_success_response_bytes(success_client: TestClient):
+    """Test probe success responses carry the pre-encoded UP payload."""
+    for path in ("/fastuator/liveness", "/fastuator/readiness"):
+        response = success_client.get(path)
+        assert response.status_code == 200
+        assert response.content == b'{"status":"UP"}'
+        assert response.headers["content-type"] == "application/json"
@@ -1,5 +1,8 @@
 """Test health check implementations."""
 
+import threading
+from unittest.mock import patch
+
 import pytest
 from fastuator.checks import cpu_health, memory_health, disk_health
 
@@ -77,3 +80,21 @@ async def test_disk_health_status_logic():
         assert result["status"] == "UP"
     else:
         assert result["status"] == "DOWN"
+
+
+@pytest.mark.asyncio
+async def test_cpu_health_non_blocking():
+    """Test CPU health samples without an interval, off the event loop."""
+    main_thread = threading.get_ident()
+    calls = []
+
+    def fake_cpu_percent(interval=None):
+        calls.append((interval, threading.get_ident()))
+        return 10.0
+
+    with patch("psutil.cpu_percent", fake_cpu_percent):
+        result = await cpu_health()
+
+    assert result["status"] == "UP"
+    assert calls[0][0] is None
+    assert calls[0][1] != main_thread
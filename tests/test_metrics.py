@@ -0,0 +1,127 @@
+"""Test Prometheus metrics collection and exposition."""
+
+import asyncio
+import time
+
+import httpx
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from fastuator import Fastuator
+
+
+def test_custom_registry(fastuator, registry):
+    """Test fastuator metrics are registered on a user-supplied registry."""
+    assert registry.get_sample_value("app_health_status") is not None
+
+
+def test_request_metrics_use_route_template(make_client, registry):
+    """Test request counter labels use the route template, not the raw path."""
+    client = make_client()
+
+    @client.app.get("/items/{item_id}")
+    async def read_item(item_id: int):
+        return {"item_id": item_id}
+
+    client.get("/items/1")
+    client.get("/items/2")
+    client.get("/fastuator/metrics")
+
+    labels = {"method": "GET", "endpoint": "/items/{item_id}", "status": "200"}
+    assert registry.get_sample_value("http_requests_total", labels) == 2
+    raw_labels = {"method": "GET", "endpoint": "/items/1", "status": "200"}
+    assert registry.get_sample_value("http_requests_total", raw_labels) is None
+
+
+def test_metrics_scrape_not_instrumented(make_client):
+    """Test scrapes of the metrics endpoint are not counted as requests."""
+    client = make_client()
+
+    client.get("/fastuator/metrics")
+    client.get("/fastuator/liveness")
+    content = client.get("/fastuator/metrics").text
+
+    assert 'endpoint="/fastuator/liveness"' in content
+    assert 'endpoint="/fastuator/metrics' not in content
+
+
+def test_metrics_endpoint_serves_own_registry(make_client):
+    """Test scrapes expose fastuator's series and no process metrics by default."""
+    client = make_client()
+
+    client.get("/fastuator/liveness")
+    content = client.get("/fastuator/metrics").text
+
+    assert "http_requests_total" in content
+    assert "app_health_status" in content
+    assert "process_cpu_seconds_total" not in content
+
+
+def test_metrics_endpoint_process_collector(make_client):
+    """Test include_process_collector adds process metrics to the scrape."""
+    client = make_client(include_process_collector=True)
+
+    assert "process_cpu_seconds_total" in client.get("/fastuator/metrics").text
+
+
+def test_request_metrics_flushed_in_batches(fastuator, registry):
+    """Test buffered request metrics are folded per label set on flush."""
+    key = ("GET", "/items/{item_id}", 200)
+    fastuator._pending_metrics.extend([(key, 0.01), (key, 0.02), (("GET", "/", 404), 0.03)])
+    fastuator._flush_metrics()
+
+    labels = {"method": "GET", "endpoint": "/items/{item_id}", "status": "200"}
+    assert registry.get_sample_value("http_requests_total", labels) == 2
+    assert registry.get_sample_value("http_request_duration_seconds_count") == 3
+    assert fastuator._pending_metrics == []
+
+
+def test_metrics_scrape_flushes_pending(success_client: TestClient):
+    """Test a scrape records requests still waiting in the buffer."""
+    success_client.get("/fastuator/liveness")
+    content = success_client.get("/fastuator/metrics").text
+
+    assert 'endpoint="/fastuator/liveness"' in content
+
+
+async def test_request_metrics_flushed_after_interval(registry):
+    """Test buffered request metrics are recorded shortly after the request."""
+    app = FastAPI()
+    Fastuator(app, registry=registry)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        await client.get("/fastuator/info")
+
+    labels = {"method": "GET", "endpoint": "/fastuator/info", "status": "200"}
+    assert registry.get_sample_value("http_requests_total", labels) is None
+
+    await asyncio.sleep(0.2)
+    assert registry.get_sample_value("http_requests_total", labels) == 1
+
+
+async def test_request_metrics_flush_rescheduled_on_new_loop(make_client, registry):
+    """Test a flush timer left on a closed loop does not block later flushes."""
+    client = make_client()
+
+    # Each TestClient request runs on its own event loop, which closes before
+    # the flush timer scheduled during that request can fire
+    client.get("/fastuator/info")
+    time.sleep(0.2)
+    client.get("/fastuator/info")
+
+    labels = {"method": "GET", "endpoint": "/fastuator/info", "status": "200"}
+    assert registry.get_sample_value("http_requests_total", labels) == 2
+
+
+def test_unmatched_requests_share_one_series(make_client, registry):
+    """Test requests matching no route do not create a series per raw path."""
+    client = make_client()
+
+    client.get("/wp-admin")
+    client.get("/.env")
+    client.get("/fastuator/metrics")
+
+    labels = {"method": "GET", "endpoint": "<unmatched>", "status": "404"}
+    assert registry.get_sample_value("http_requests_total", labels) == 2
+    raw_labels = {"method": "GET", "endpoint": "/.env", "status": "404"}
+    assert registry.get_sample_value("http_requests_total", raw_labels) is None
@@ -6,6 +6,14 @@ from unittest.mock import patch
 from fastuator.core import get_package_version
 
 
+@pytest.fixture(autouse=True)
+def clear_version_cache():
+    """Clear the cached version so each test sees its own patched lookup."""
+    get_package_version.cache_clear()
+    yield
+    get_package_version.cache_clear()
+
+
 def test_dev_mode_fallback():
     """Test dev version when package not installed."""
     with patch("importlib.metadata.version") as mock_version:
@@ -33,3 +41,13 @@ def test_version_format(version):
         result = get_package_version()
         assert isinstance(result, str)
         assert result == version or result == "dev"
+
+
+def test_version_cached():
+    """Test the installed version is only looked up once."""
+    with patch("importlib.metadata.version") as mock_version:
+        mock_version.return_value = "0.0.1"
+
+        assert get_package_version() == "0.0.1"
+        assert get_package_version() == "0.0.1"
+        mock_version.assert_called_once()